@@ -4,20 +4,56 @@ CLI interface for glon package - Git Clone utility.
 
 import os
 import sys
+import shutil
 import subprocess
-import argparse
 from pathlib import Path
-from typing import Optional, List
+from typing import TYPE_CHECKING, Any, Optional, List, Dict, Tuple
 import re
-from datetime import datetime, timedelta
 
-# Try to import argcomplete for tab completion
-try:
-    import argcomplete
-    from argcomplete.completers import ChoicesCompleter
-    ARGCOMPLETE_AVAILABLE = True
-except ImportError:
-    ARGCOMPLETE_AVAILABLE = False
+# argparse, datetime and argcomplete are imported where they are used, so
+# commands that do not need them (e.g. a plain clone) start faster
+if TYPE_CHECKING:
+    import argparse
+    from datetime import datetime
+    from types import ModuleType
+
+# Git URL patterns, compiled once at import time
+# SSH format: git@github.com:owner/repo.git
+_SSH_RE = re.compile(r'git@[^:]+:([^/]+)/([^/]+)\.git$')
+# HTTPS format with or without .git: https://github.com/owner/repo[.git]
+# (the .git form is tried first, as the original two separate patterns were)
+_HTTPS_RE = re.compile(r'https://[^/]+/([^/]+)/(?:([^/]+)\.git|([^/]+))$')
+
+# Default base path for cloned projects, resolved once per process
+_DEFAULT_BASE = os.path.expanduser("~/github")
+
+# Subcommands recognised by main(); anything else is treated as a clone URL
+_SUBCOMMANDS = frozenset(("clone", "open", "list", "ls", "grab"))
+
+# IDE names accepted by 'glon open --ide'
+_IDE_CHOICES = ["pycharm", "idea", "vscode", "code", "webstorm", "goland", "rider"]
+
+# Maximum number of threads used to scan owner directories
+_SCAN_WORKERS = 16
+
+# Time filter aliases mapped to the number of days they reach back
+_FILTER_DAYS = {
+    alias: days
+    for aliases, days in (
+        (("today", "last day", "1 day", "last today"), 1),
+        (("last week", "1 week", "week"), 7),
+        (("last month", "1 month", "month"), 30),
+        (("last 3 months", "3 months", "3months", "last 3months"), 90),
+        (("last 6 months", "6 months", "6months", "last 6months"), 180),
+        (("last year", "1 year", "year"), 365),
+    )
+    for alias in aliases
+}
+# Time filters that mean "no filtering"
+_FILTER_ALL = frozenset(("all", "everything", "*"))
+
+# Project name cache: base path -> (directory signature, sorted project names)
+_projects_cache: Dict[str, Tuple[list, List[str]]] = {}
 
 
 def get_all_projects(base_path: Optional[str] = None) -> List[str]:
@@ -30,8 +66,183 @@ def get_all_projects(base_path: Optional[str] = None) -> List[str]:
     Returns:
         List of project paths in "owner/repo" format
     """
-    projects_with_time = get_all_projects_with_time(base_path)
-    return sorted([p["name"] for p in projects_with_time])
+    if base_path is None:
+        base_path = _DEFAULT_BASE
+    
+    try:
+        signature = _projects_signature(base_path)
+    except OSError:
+        return []
+    
+    # Reuse the previous scan while no owner directory has changed
+    cached = _projects_cache.get(base_path) or _load_projects_cache(base_path)
+    if cached and cached[0] == signature:
+        return list(cached[1])
+    
+    try:
+        projects = sorted(f"{owner}/{repo}" for _, owner, repo, _, _ in _scan_projects(base_path))
+    except OSError:
+        return []
+    
+    _projects_cache[base_path] = (signature, projects)
+    _save_projects_cache(base_path, signature, projects)
+    return list(projects)
+
+
+def _projects_signature(base_path: str) -> list:
+    """
+    Build a cheap signature of the project tree under base_path.
+    
+    Adding or removing an owner changes the base directory mtime, and
+    adding or removing a repo changes its owner directory mtime, so the
+    signature changes whenever the set of projects does.
+    
+    Args:
+        base_path: Base path to search
+        
+    Returns:
+        Sorted list of [name, mtime_ns] pairs for base_path and its owners
+        
+    Raises:
+        OSError: If base_path cannot be read
+    """
+    signature = [["", os.stat(base_path).st_mtime_ns]]
+    with os.scandir(base_path) as entries:
+        for entry in entries:
+            if not entry.is_dir():
+                continue
+            try:
+                signature.append([entry.name, entry.stat().st_mtime_ns])
+            except OSError:
+                continue
+    signature.sort()
+    return signature
+
+
+def _projects_cache_file() -> Path:
+    """Return the on-disk location of the project name cache."""
+    cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache")
+    return Path(cache_home) / "glon" / "projects.json"
+
+
+def _load_projects_cache(base_path: str) -> Optional[Tuple[list, List[str]]]:
+    """Load cached (signature, projects) for base_path from disk, if present."""
+    import json
+    
+    try:
+        with open(_projects_cache_file(), encoding="utf-8") as f:
+            entry = json.load(f)[base_path]
+        cached = (entry["signature"], entry["projects"])
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+    
+    _projects_cache[base_path] = cached
+    return cached
+
+
+def _save_projects_cache(base_path: str, signature: list, projects: List[str]) -> None:
+    """Persist (signature, projects) for base_path; failures are ignored."""
+    import json
+    
+    cache_file = _projects_cache_file()
+    try:
+        with open(cache_file, encoding="utf-8") as f:
+            data = json.load(f)
+        if not isinstance(data, dict):
+            data = {}
+    except (OSError, ValueError):
+        data = {}
+    
+    data[base_path] = {"signature": signature, "projects": projects}
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.tmp")
+        with open(tmp_file, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+        os.replace(tmp_file, cache_file)
+    except OSError:
+        pass
+
+
+def _scan_owner_dir(
+    owner_path: str,
+    owner: str,
+    check_git: bool = False,
+    min_mtime: Optional[float] = None
+) -> List[tuple]:
+    """
+    Scan one owner directory for repository directories.
+    
+    Args:
+        owner_path: Path to the owner directory
+        owner: Owner name
+        check_git: Also check each repository for a .git entry
+        min_mtime: Skip repositories modified before this timestamp (or
+            whose mtime cannot be read)
+        
+    Returns:
+        List of (path, owner, repo, mtime, is_git) tuples; mtime is None if
+        stat failed and is_git is None unless check_git is set
+    """
+    repos = []
+    try:
+        # DirEntry caches the file type from readdir, so is_dir() usually
+        # needs no extra stat call
+        with os.scandir(owner_path) as entries:
+            for entry in entries:
+                if not entry.is_dir():
+                    continue
+                try:
+                    mtime = entry.stat().st_mtime
+                except OSError:
+                    mtime = None
+                # Drop filtered-out repos before paying for the .git check
+                if min_mtime is not None and (mtime is None or mtime < min_mtime):
+                    continue
+                # Check for .git while the owner directory is hot in the
+                # dentry cache rather than in a second pass
+                is_git = os.path.exists(os.path.join(entry.path, ".git")) if check_git else None
+                repos.append((entry.path, owner, entry.name, mtime, is_git))
+    except OSError:
+        pass
+    return repos
+
+
+def _scan_projects(
+    base_path: str,
+    check_git: bool = False,
+    min_mtime: Optional[float] = None
+) -> List[tuple]:
+    """
+    Scan base_path/owner/repo directories, one owner per worker thread.
+    
+    Args:
+        base_path: Base path to search
+        check_git: Also check each repository for a .git entry
+        min_mtime: Skip repositories modified before this timestamp
+        
+    Returns:
+        List of (path, owner, repo, mtime, is_git) tuples in no particular order
+        
+    Raises:
+        OSError: If base_path cannot be read
+    """
+    with os.scandir(base_path) as entries:
+        owners = [(entry.path, entry.name) for entry in entries if entry.is_dir()]
+    
+    if len(owners) <= 1:
+        results = [_scan_owner_dir(path, owner, check_git, min_mtime) for path, owner in owners]
+    else:
+        # Directory reads are I/O bound; overlapping them pays off on cold
+        # caches and network filesystems
+        from concurrent.futures import ThreadPoolExecutor
+        
+        with ThreadPoolExecutor(max_workers=min(_SCAN_WORKERS, len(owners))) as executor:
+            results = list(executor.map(
+                lambda o: _scan_owner_dir(o[0], o[1], check_git, min_mtime), owners
+            ))
+    
+    return [repo for repos in results for repo in repos]
 
 
 def get_all_projects_with_time(base_path: Optional[str] = None) -> List[dict]:
@@ -45,65 +256,85 @@ def get_all_projects_with_time(base_path: Optional[str] = None) -> List[dict]:
         List of dicts with project info including modification time
     """
     if base_path is None:
-        base_path = os.path.expanduser("~/github")
+        base_path = _DEFAULT_BASE
+    
+    from datetime import datetime
     
-    base_path_obj = Path(base_path)
     projects = []
     
-    if not base_path_obj.exists():
+    try:
+        scanned = _scan_projects(base_path)
+    except OSError:
         return projects
     
-    for owner_dir in base_path_obj.iterdir():
-        if not owner_dir.is_dir():
-            continue
-        
-        for repo_dir in owner_dir.iterdir():
-            if not repo_dir.is_dir():
-                continue
-            
-            try:
-                mtime = datetime.fromtimestamp(repo_dir.stat().st_mtime)
-            except OSError:
-                mtime = datetime.min
-            
-            projects.append({
-                "name": f"{owner_dir.name}/{repo_dir.name}",
-                "path": repo_dir,
-                "mtime": mtime,
-                "owner": owner_dir.name,
-                "repo": repo_dir.name
-            })
+    for path, owner, repo, st_mtime, _ in scanned:
+        mtime = datetime.fromtimestamp(st_mtime) if st_mtime is not None else datetime.min
+        projects.append({
+            "name": f"{owner}/{repo}",
+            "path": Path(path),
+            "mtime": mtime,
+            "owner": owner,
+            "repo": repo
+        })
     
     return sorted(projects, key=lambda x: x["mtime"], reverse=True)
 
 
+# Clipboard reader commands, resolved against PATH on first use
+_CLIPBOARD_COMMANDS = (
+    ["wl-paste", "-n"],
+    ["xclip", "-o", "-selection", "clipboard"],
+    ["xsel", "--clipboard", "--output"],
+    ["pbpaste"],
+)
+_available_clipboard_commands: Optional[List[List[str]]] = None
+
+
+def _get_clipboard_commands() -> List[List[str]]:
+    global _available_clipboard_commands
+    if _available_clipboard_commands is None:
+        _available_clipboard_commands = [
+            cmd for cmd in _CLIPBOARD_COMMANDS if shutil.which(cmd[0])
+        ]
+    return _available_clipboard_commands
+
+
 def _read_clipboard_text() -> Optional[str]:
+    """Return the clipboard text stripped of surrounding whitespace, or None.
+
+    The first backend that reads the clipboard successfully decides the
+    result, even when that result is empty; later backends are only tried
+    when an earlier one is missing or fails.
+    """
     try:
-        import tkinter
+        import pyperclip
 
-        root = tkinter.Tk()
-        root.withdraw()
-        try:
-            text = root.clipboard_get()
-        finally:
-            root.destroy()
-        return text
+        return (pyperclip.paste() or "").strip() or None
     except Exception:
         pass
 
-    for cmd in (
-        ["wl-paste", "-n"],
-        ["xclip", "-o", "-selection", "clipboard"],
-        ["xsel", "--clipboard", "--output"],
-    ):
+    for cmd in _get_clipboard_commands():
         try:
             result = subprocess.run(cmd, capture_output=True, text=True, check=True)
         except Exception:
             continue
 
-        text = (result.stdout or "").strip()
+        return (result.stdout or "").strip() or None
+
+    # Last resort: Tk is slow to start, so only use it when nothing else works
+    try:
+        import tkinter
+
+        root = tkinter.Tk()
+        root.withdraw()
+        try:
+            text = root.clipboard_get().strip()
+        finally:
+            root.destroy()
         if text:
             return text
+    except Exception:
+        pass
 
     return None
 
@@ -149,15 +380,12 @@ def _extract_git_url_from_text(text: str) -> Optional[str]:
 
 
 def _clipboard_url_candidate(max_len: int = 200) -> Optional[str]:
+    # _read_clipboard_text already strips the text and never returns ""
     text = _read_clipboard_text()
-    if text is None:
-        return None
-
-    text = text.strip()
-    if not text or len(text) > max_len:
+    if text is None or len(text) > max_len:
         return None
 
-    if any(ch in text for ch in ("\n", "\r", "\t")):
+    if "\n" in text or "\r" in text or "\t" in text:
         return None
 
     if parse_git_url(text) is None:
@@ -176,23 +404,35 @@ def parse_git_url(url: str) -> Optional[tuple]:
     Returns:
         Tuple of (owner, repo) or None if invalid
     """
-    # SSH format: git@github.com:owner/repo.git
-    ssh_pattern = r'git@[^:]+:([^/]+)/([^/]+)\.git$'
-    ssh_match = re.match(ssh_pattern, url)
-    if ssh_match:
-        return ssh_match.group(1), ssh_match.group(2)
-    
-    # HTTPS format: https://github.com/owner/repo.git
-    https_pattern = r'https://[^/]+/([^/]+)/([^/]+)\.git$'
-    https_match = re.match(https_pattern, url)
-    if https_match:
-        return https_match.group(1), https_match.group(2)
-    
-    # HTTPS format without .git: https://github.com/owner/repo
-    https_pattern_no_git = r'https://[^/]+/([^/]+)/([^/]+)$'
-    https_match_no_git = re.match(https_pattern_no_git, url)
-    if https_match_no_git:
-        return https_match_no_git.group(1), https_match_no_git.group(2)
+    if not url.startswith(("git@", "https://")):
+        return None
+    
+    # Fast path: plain string splitting handles well-formed URLs without regex.
+    # The regexes' "$" also matches before a trailing newline, so such input
+    # is left to them to keep results identical.
+    if not url.endswith("\n"):
+        if url.startswith("https://"):
+            parts = url[8:].split("/")
+            if len(parts) == 3 and all(parts):
+                repo = parts[2]
+                if repo.endswith(".git") and len(repo) > 4:
+                    repo = repo[:-4]
+                return parts[1], repo
+        else:
+            host, sep, path = url[4:].partition(":")
+            if host and sep and path.endswith(".git"):
+                parts = path[:-4].split("/")
+                if len(parts) == 2 and all(parts):
+                    return parts[0], parts[1]
+    
+    # Fall back to regex for anything the fast path did not accept
+    match = _SSH_RE.match(url)
+    if match:
+        return match.group(1), match.group(2)
+    
+    match = _HTTPS_RE.match(url)
+    if match:
+        return match.group(1), match.group(2) or match.group(3)
     
     return None
 
@@ -210,7 +450,7 @@ def create_directory_structure(owner: str, repo: str, base_path: Optional[str] =
         Path to created directory
     """
     if base_path is None:
-        base_path = os.path.expanduser("~/github")
+        base_path = _DEFAULT_BASE
     
     target_dir = Path(base_path) / owner / repo
     target_dir.mkdir(parents=True, exist_ok=True)
@@ -218,30 +458,133 @@ def create_directory_structure(owner: str, repo: str, base_path: Optional[str] =
     return target_dir
 
 
-def clone_repository(url: str, target_dir: Path) -> bool:
+def _is_dir_empty(path: Path) -> bool:
+    """Return True if path has no entries, stopping at the first one found."""
+    with os.scandir(path) as entries:
+        return next(entries, None) is None
+
+
+def _run_commands(commands: List[List[str]]) -> subprocess.CompletedProcess:
+    """
+    Run one or more commands, stopping at the first failure.
+    
+    A single command is executed directly. Several commands are chained
+    with && in one POSIX shell, so follow-up git operations share a
+    single process spawn instead of paying fork+exec each time.
+    
+    Args:
+        commands: List of argv lists to run in order
+        
+    Returns:
+        CompletedProcess of the executed command or shell
+        
+    Raises:
+        ValueError: If commands is empty
+        subprocess.CalledProcessError: If any command fails
+        FileNotFoundError: If an executable (or the shell) is not found
+    """
+    if not commands:
+        raise ValueError("No commands to run")
+    
+    if len(commands) == 1 or os.name == "nt":
+        for cmd in commands:
+            result = subprocess.run(cmd, capture_output=True, text=True, check=True)
+        return result
+    
+    import shlex
+    
+    script = " && ".join(" ".join(shlex.quote(arg) for arg in cmd) for cmd in commands)
+    try:
+        return subprocess.run(["sh", "-c", script], capture_output=True, text=True, check=True)
+    except subprocess.CalledProcessError as e:
+        # The shell reports a missing executable as exit status 127; raise
+        # what a direct subprocess.run would so callers handle both alike
+        if e.returncode == 127:
+            raise FileNotFoundError((e.stderr or "").strip() or "Command not found") from e
+        raise
+
+
+def _load_pygit2() -> Optional["ModuleType"]:
+    """
+    Return the pygit2 module when libgit2 cloning is enabled.
+    
+    libgit2 avoids spawning a git process per clone, which helps when many
+    small repositories are cloned in a row; the git CLI stays the default
+    since it is faster for single large repositories.
+    
+    Returns:
+        pygit2 module, or None if GLON_USE_LIBGIT2 is not "1" or pygit2
+        is not installed
+    """
+    if os.environ.get("GLON_USE_LIBGIT2") != "1":
+        return None
+    try:
+        import pygit2
+    except ImportError:
+        return None
+    return pygit2
+
+
+def clone_repository(
+    url: str,
+    target_dir: Path,
+    depth: Optional[int] = None,
+    blobless: bool = False,
+    single_branch: bool = False,
+    submodule_jobs: Optional[int] = None
+) -> bool:
     """
     Clone git repository to target directory.
     
     Args:
         url: Git URL to clone
         target_dir: Target directory for cloning
+        depth: Create a shallow clone with this many commits
+        blobless: Partial clone that fetches file contents on demand
+        single_branch: Clone only the default branch
+        submodule_jobs: Clone submodules recursively with this many jobs
         
     Returns:
         True if successful, False otherwise
     """
     try:
         # Check if directory is empty
-        if any(target_dir.iterdir()):
+        if not _is_dir_empty(target_dir):
             print(f"Directory {target_dir} is not empty. Skipping clone.")
             return False
         
-        # Clone the repository
-        result = subprocess.run(
-            ["git", "clone", url, str(target_dir)],
-            capture_output=True,
-            text=True,
-            check=True
-        )
+        cmd = ["git", "clone"]
+        if depth is not None:
+            cmd += ["--depth", str(depth)]
+        if blobless:
+            cmd.append("--filter=blob:none")
+        if single_branch:
+            cmd.append("--single-branch")
+        if submodule_jobs is not None:
+            cmd += ["--recurse-submodules", "--jobs", str(submodule_jobs)]
+        has_options = len(cmd) > 2
+        cmd += [url, str(target_dir)]
+        
+        # Clone the repository, in-process via libgit2 when enabled; the
+        # clone options above are only supported by the git CLI
+        pygit2 = None if has_options else _load_pygit2()
+        if pygit2 is not None:
+            callbacks = None
+            if url.startswith("git@"):
+                # libgit2 has no default SSH credentials; use the ssh-agent
+                # keys like the git CLI would, for the user in the URL
+                username = url.partition("@")[0]
+                callbacks = pygit2.RemoteCallbacks(
+                    credentials=pygit2.KeypairFromAgent(username)
+                )
+            try:
+                pygit2.clone_repository(url, str(target_dir), callbacks=callbacks)
+            except (pygit2.GitError, ValueError, KeyError) as e:
+                # pygit2 maps some libgit2 errors to ValueError/KeyError
+                print(f"Failed to clone repository: {e}")
+                return False
+        else:
+            _run_commands([cmd])
         
         print(f"Successfully cloned {url} to {target_dir}")
         return True
@@ -274,16 +617,11 @@ def grab_from_clipboard(base_path: Optional[str] = None, dry_run: bool = False,
     # Try to read from clipboard
     clipboard_text = _read_clipboard_text()
     
+    # Already stripped; None covers both an empty and an unreadable clipboard
     if clipboard_text is None:
         print("Error: Clipboard is empty or could not be read.")
         return False
     
-    clipboard_text = clipboard_text.strip()
-    
-    if not clipboard_text:
-        print("Error: Clipboard is empty.")
-        return False
-    
     if verbose:
         print(f"Clipboard content: {clipboard_text}")
     
@@ -330,7 +668,7 @@ def grab_from_clipboard(base_path: Optional[str] = None, dry_run: bool = False,
     
     # Create target directory in base_path
     if base_path is None:
-        base_path = os.path.expanduser("~/github")
+        base_path = _DEFAULT_BASE
     
     target_dir = Path(base_path) / dir_name
     target_dir.mkdir(parents=True, exist_ok=True)
@@ -343,7 +681,7 @@ def grab_from_clipboard(base_path: Optional[str] = None, dry_run: bool = False,
         return True
     
     # Check if target is empty
-    if any(target_dir.iterdir()):
+    if not _is_dir_empty(target_dir):
         print(f"Warning: Directory {target_dir} is not empty. Skipping.")
         return False
     
@@ -352,14 +690,17 @@ def grab_from_clipboard(base_path: Optional[str] = None, dry_run: bool = False,
         if source_path.is_dir():
             # For directories, create a symlink to the source
             link_path = target_dir / source_path.name
-            if link_path.exists() or link_path.is_symlink():
+            # target_dir was empty above, so only a concurrent writer can have
+            # created link_path; symlink_to refuses any existing entry,
+            # dangling symlinks included, without a separate stat
+            try:
+                link_path.symlink_to(source_path.resolve())
+            except FileExistsError:
                 print(f"Symlink already exists at {link_path}")
             else:
-                link_path.symlink_to(source_path.resolve())
                 print(f"Created symlink: {link_path} -> {source_path}")
         else:
             # For files, copy them
-            import shutil
             shutil.copy2(source_path, target_dir / source_path.name)
             print(f"Copied {source_path} to {target_dir}")
         
@@ -371,35 +712,26 @@ def grab_from_clipboard(base_path: Optional[str] = None, dry_run: bool = False,
         return False
 
 
-def parse_time_filter(filter_str: str) -> Optional[datetime]:
+def parse_time_filter(filter_str: str, now: Optional["datetime"] = None) -> Optional["datetime"]:
     """
     Parse time filter string like 'last month', 'last week', 'today'.
     
     Args:
         filter_str: Time filter string
+        now: Reference time (default: current time)
         
     Returns:
         datetime object or None if invalid
     """
-    filter_str = filter_str.lower().strip()
-    now = datetime.now()
-    
-    if filter_str in ("today", "last day", "1 day"):
-        return now - timedelta(days=1)
-    elif filter_str in ("last week", "1 week", "week"):
-        return now - timedelta(weeks=1)
-    elif filter_str in ("last month", "1 month", "month"):
-        return now - timedelta(days=30)
-    elif filter_str in ("last 3 months", "3 months"):
-        return now - timedelta(days=90)
-    elif filter_str in ("last 6 months", "6 months"):
-        return now - timedelta(days=180)
-    elif filter_str in ("last year", "1 year", "year"):
-        return now - timedelta(days=365)
-    elif filter_str in ("all", "everything", "*"):
+    days = _FILTER_DAYS.get(filter_str.lower().strip())
+    if days is None:
         return None
     
-    return None
+    from datetime import datetime, timedelta
+    
+    if now is None:
+        now = datetime.now()
+    return now - timedelta(days=days)
 
 
 def list_projects(base_path: Optional[str] = None, time_filter: Optional[str] = None, verbose: bool = False, limit: Optional[int] = None) -> bool:
@@ -415,51 +747,47 @@ def list_projects(base_path: Optional[str] = None, time_filter: Optional[str] =
     Returns:
         True if successful, False otherwise
     """
-    if base_path is None:
-        base_path = os.path.expanduser("~/github")
+    from datetime import datetime, timedelta
     
-    base_path_obj = Path(base_path)
+    if base_path is None:
+        base_path = _DEFAULT_BASE
     
-    if not base_path_obj.exists():
+    if not os.path.exists(base_path):
         print(f"Error: Base path does not exist: {base_path}")
         return False
     
     # Parse time filter
     filter_date = None
     if time_filter:
-        filter_date = parse_time_filter(time_filter)
-        if time_filter and filter_date is None and time_filter not in ("all", "everything", "*"):
+        now = datetime.now()
+        filter_date = parse_time_filter(time_filter, now)
+        if filter_date is None and time_filter not in _FILTER_ALL:
             # Check if it's a number (e.g., "30" for 30 days)
             try:
                 days = int(time_filter)
-                filter_date = now = datetime.now() - timedelta(days=days)
+                filter_date = now - timedelta(days=days)
             except ValueError:
                 print(f"Warning: Unknown time filter '{time_filter}', showing all projects")
     
     # Collect all projects
     projects = []
     
-    for owner_dir in base_path_obj.iterdir():
-        if not owner_dir.is_dir():
-            continue
+    # The time filter is applied during the scan. With a limit most repos
+    # are never printed, so .git is checked later for the shown rows only.
+    # Paths stay plain strings here; only the printed form is ever needed
+    min_mtime = filter_date.timestamp() if filter_date else None
+    scanned = _scan_projects(base_path, check_git=not limit, min_mtime=min_mtime)
+    for path, owner, repo, st_mtime, is_git in scanned:
+        # Get modification time
+        mtime = datetime.fromtimestamp(st_mtime) if st_mtime is not None else datetime.min
         
-        for repo_dir in owner_dir.iterdir():
-            if not repo_dir.is_dir():
-                continue
-            
-            # Get modification time
-            mtime = datetime.fromtimestamp(repo_dir.stat().st_mtime)
-            
-            # Apply time filter
-            if filter_date and mtime < filter_date:
-                continue
-            
-            projects.append({
-                "path": repo_dir,
-                "owner": owner_dir.name,
-                "repo": repo_dir.name,
-                "mtime": mtime
-            })
+        projects.append({
+            "path": path,
+            "owner": owner,
+            "repo": repo,
+            "mtime": mtime,
+            "is_git": is_git
+        })
     
     if not projects:
         print(f"No projects found in {base_path}")
@@ -467,13 +795,15 @@ def list_projects(base_path: Optional[str] = None, time_filter: Optional[str] =
             print(f"  (No projects modified {time_filter})")
         return True
     
-    # Sort by modification time (newest first)
-    projects.sort(key=lambda x: x["mtime"], reverse=True)
-    
-    # Apply limit
+    # Sort by modification time (newest first); with a limit only the
+    # newest entries are needed, so select them without a full sort
     total_count = len(projects)
     if limit:
-        projects = projects[:limit]
+        import heapq
+        
+        projects = heapq.nlargest(limit, projects, key=lambda x: x["mtime"])
+    else:
+        projects.sort(key=lambda x: x["mtime"], reverse=True)
     
     # Print header
     print(f"\nFound {total_count} project(s) in {base_path}")
@@ -483,28 +813,34 @@ def list_projects(base_path: Optional[str] = None, time_filter: Optional[str] =
         print(f"Showing {len(projects)} result(s)")
     print("-" * 80)
     
-    # Print projects
+    # Print projects, building the output first and writing it in one call
+    lines: List[str] = []
+    append = lines.append
     for project in projects:
         path = project["path"]
         owner = project["owner"]
         repo = project["repo"]
-        mtime = project["mtime"]
         
         # Format date
-        date_str = mtime.strftime("%Y-%m-%d %H:%M")
+        date_str = f"{project['mtime']:%Y-%m-%d %H:%M}"
         
-        # Check if it's a git repository
-        is_git = (path / ".git").exists()
+        is_git = project["is_git"]
+        if is_git is None:
+            is_git = os.path.exists(os.path.join(path, ".git"))
         
         if verbose:
-            print(f"{owner}/{repo}")
-            print(f"  Path: {path}")
-            print(f"  Modified: {date_str}")
-            print(f"  Git: {'Yes' if is_git else 'No'}")
-            print()
+            append(
+                f"{owner}/{repo}\n"
+                f"  Path: {path}\n"
+                f"  Modified: {date_str}\n"
+                f"  Git: {'Yes' if is_git else 'No'}\n"
+                "\n"
+            )
         else:
             git_marker = "✓" if is_git else "✗"
-            print(f"{date_str} {git_marker} {owner}/{repo}")
+            append(f"{date_str} {git_marker} {owner}/{repo}\n")
+    
+    sys.stdout.write("".join(lines))
     
     return True
 
@@ -526,7 +862,7 @@ def open_in_ide(project_path: str, ide: Optional[str] = None) -> bool:
         parts = project_path.split("/")
         if len(parts) == 2:
             owner, repo = parts
-            base_path = os.path.expanduser("~/github")
+            base_path = _DEFAULT_BASE
             full_path = Path(base_path) / owner / repo
         else:
             print(f"Error: Invalid project path format: {project_path}")
@@ -604,451 +940,499 @@ def open_in_ide(project_path: str, ide: Optional[str] = None) -> bool:
         return False
 
 
-def main():
-    """Main CLI entry point."""
-    # Check if open command is being used
-    if "open" in sys.argv:
-        # Filter out 'open' from sys.argv
-        open_args = [arg for arg in sys.argv[1:] if arg != "open"]
-        
-        # Get all available projects
-        all_projects = get_all_projects()
-        
-        # If no project specified, check clipboard first
-        if not open_args or open_args[0].startswith("-"):
-            # Try to get clipboard content
-            clipboard_content = _read_clipboard_text()
-            if clipboard_content:
-                # Extract git URL from clipboard (handles multi-line content)
-                git_url = _extract_git_url_from_text(clipboard_content)
-                if git_url:
-                    parsed = parse_git_url(git_url)
-                    if parsed:
-                        owner, repo = parsed
-                        project_name = f"{owner}/{repo}"
-                        print(f"Detected git URL in clipboard: {git_url}")
-                        
-                        # Check if project already exists
-                        base_path = os.path.expanduser("~/github")
-                        project_path = Path(base_path) / owner / repo
-                        
-                        if project_path.exists():
-                            print(f"Project already exists at: {project_path}")
-                            # Continue with opening this project
-                        else:
-                            print(f"Project not found locally. Cloning first...")
-                            # Clone the repository
-                            target_dir = create_directory_structure(owner, repo)
-                            success = clone_repository(git_url, target_dir)
-                            if success:
-                                project_path = target_dir
-                            else:
-                                print("Failed to clone repository. Showing available projects:")
-                                for project in all_projects:
-                                    print(f"  {project}")
-                                print("\nUsage: glon open <project>")
-                                print("Example: glon open tom-sapletta-com/xeen")
-                                return
-                        
-                        # Parse IDE arguments if any
-                        parser = argparse.ArgumentParser(
-                            description="Open project in IDE",
-                            prog="glon open"
-                        )
-                        parser.add_argument(
-                            "--ide",
-                            default=None,
-                            choices=["pycharm", "idea", "vscode", "code", "webstorm", "goland", "rider"],
-                            help="IDE to use (pycharm, idea, vscode, webstorm, goland, rider)"
-                        )
-                        
-                        # Filter IDE args from open_args
-                        ide_args = [arg for arg in open_args if arg.startswith("--")]
-                        args = parser.parse_args(ide_args)
-                        
-                        open_in_ide(str(project_path), args.ide)
-                        return
-            
-            # No valid clipboard content, show numbered list of recent projects
-            all_projects_with_time = get_all_projects_with_time()
-            if not all_projects_with_time:
-                print("No projects found.")
-                return
-            
-            # Show last 10 projects sorted by modification time
-            recent_projects = all_projects_with_time[:10]
-            print(f"\nRecent projects (last {len(recent_projects)}):")
-            print("-" * 50)
-            now = datetime.now()
-            today = now.replace(hour=0, minute=0, second=0, microsecond=0)
-            yesterday = today - timedelta(days=1)
-            
-            for i, p in enumerate(recent_projects, 1):
-                mtime = p["mtime"]
-                age = now - mtime
-                if mtime >= today:
-                    age_str = "today"
-                elif mtime >= yesterday:
-                    age_str = "yesterday"
-                elif age.days < 7:
-                    age_str = f"{age.days} days ago"
-                elif age.days < 30:
-                    age_str = f"{age.days // 7} weeks ago"
-                else:
-                    age_str = f"{age.days // 30} months ago"
-                print(f"  {i}. {p['name']} ({age_str})")
-            
-            print("-" * 50)
-            
-            try:
-                choice = input(f"Select project (1-{len(recent_projects)}) or press Enter to cancel: ").strip()
-                if not choice:
-                    print("Canceled.")
-                    return
-                
-                idx = int(choice) - 1
-                if 0 <= idx < len(recent_projects):
-                    project_to_open = recent_projects[idx]["name"]
-                    
-                    # Parse IDE arguments if any
-                    parser = argparse.ArgumentParser(
-                        description="Open project in IDE",
-                        prog="glon open"
-                    )
-                    parser.add_argument(
-                        "--ide",
-                        default=None,
-                        choices=["pycharm", "idea", "vscode", "code", "webstorm", "goland", "rider"],
-                        help="IDE to use (pycharm, idea, vscode, webstorm, goland, rider)"
-                    )
-                    
-                    # Filter IDE args from open_args
-                    ide_args = [arg for arg in open_args if arg.startswith("--")]
-                    args = parser.parse_args(ide_args)
-                    
-                    open_in_ide(project_to_open, args.ide)
-                else:
-                    print(f"Invalid selection: {choice}")
-            except ValueError:
-                print(f"Invalid input: {choice}")
-            except EOFError:
-                print("No input received.")
-            return
-        
-        # Get the project name (first non-flag argument)
-        project_name = open_args[0]
-        
-        # Check if it's a full path (absolute path provided directly)
-        if os.path.isabs(project_name) or Path(project_name).exists():
-            # It's a full path, use it directly
-            full_path = Path(project_name).resolve()
-            if full_path.exists() and full_path.is_dir():
-                # Parse IDE arguments
-                parser = argparse.ArgumentParser(
-                    description="Open project in IDE",
-                    prog="glon open"
-                )
-                parser.add_argument(
-                    "--ide",
-                    default=None,
-                    choices=["pycharm", "idea", "vscode", "code", "webstorm", "goland", "rider"],
-                    help="IDE to use"
-                )
-                # Parse IDE arguments - include --ide and its value
-                ide_args = []
-                skip_next = False
-                for i, arg in enumerate(open_args):
-                    if skip_next:
-                        skip_next = False
-                        continue
-                    if arg.startswith("--"):
-                        ide_args.append(arg)
-                        # Check if next arg is a value (not a flag)
-                        if i + 1 < len(open_args) and not open_args[i + 1].startswith("-"):
-                            ide_args.append(open_args[i + 1])
-                            skip_next = True
-                args = parser.parse_args(ide_args)
-                open_in_ide(str(full_path), args.ide)
-                return
-        
-        # Get all projects with their modification times
-        all_projects_with_time = get_all_projects_with_time()
-        
-        # Filter projects that match the input (case-insensitive partial match)
-        matching_projects_with_time = [
-            p for p in all_projects_with_time 
-            if project_name.lower() in p["name"].lower()
-        ]
-        
-        if not matching_projects_with_time:
-            print(f"No projects found matching: {project_name}")
-            print("\nAvailable projects:")
-            for project in all_projects:
-                print(f"  {project}")
-            return
-        
-        # Get project names from matches
-        matching_projects = [p["name"] for p in matching_projects_with_time]
-        
-        # If there's exactly one match, use it
-        if len(matching_projects) == 1:
-            project_to_open = matching_projects[0]
-        else:
-            # Multiple matches - use smart selection
-            now = datetime.now()
-            today = now.replace(hour=0, minute=0, second=0, microsecond=0)
-            yesterday = today - timedelta(days=1)
-            
-            # Check if any matching project was modified today
-            today_projects = [p for p in matching_projects_with_time if p["mtime"] >= today]
-            yesterday_projects = [p for p in matching_projects_with_time if p["mtime"] >= yesterday]
-            
-            if today_projects:
-                # Use the most recently modified project from today
-                most_recent = max(today_projects, key=lambda x: x["mtime"])
-                project_to_open = most_recent["name"]
-                print(f"Opening most recently modified (today): {project_to_open}")
-            elif len(yesterday_projects) >= 1:
-                # Multiple matches from yesterday or older - show interactive selection
-                print(f"Projects matching '{project_name}':")
-                print("-" * 50)
-                for i, p in enumerate(matching_projects_with_time, 1):
-                    mtime = p["mtime"]
-                    age = now - mtime
-                    if mtime >= today:
-                        age_str = "today"
-                    elif mtime >= yesterday:
-                        age_str = "yesterday"
-                    elif age.days < 7:
-                        age_str = f"{age.days} days ago"
-                    elif age.days < 30:
-                        age_str = f"{age.days // 7} weeks ago"
-                    else:
-                        age_str = f"{age.days // 30} months ago"
-                    print(f"  {i}. {p['name']} ({age_str})")
-                
-                print("-" * 50)
-                try:
-                    choice = input(f"Select project (1-{len(matching_projects)}) or press Enter for first: ").strip()
-                    if choice:
-                        idx = int(choice) - 1
-                        if 0 <= idx < len(matching_projects):
-                            project_to_open = matching_projects[idx]
-                        else:
-                            print("Invalid selection, using first match.")
-                            project_to_open = matching_projects[0]
-                    else:
-                        project_to_open = matching_projects[0]
-                except (ValueError, EOFError):
-                    project_to_open = matching_projects[0]
-            else:
-                # No recent matches, use first one
-                project_to_open = matching_projects[0]
-        
-        parser = argparse.ArgumentParser(
-            description="Open project in IDE",
-            prog="glon open"
-        )
-        
-        # Add project argument with choices for autocomplete
-        project_arg = parser.add_argument(
-            "project",
-            help="Project path (owner/repo or full path)"
-        )
-        
-        # If argcomplete is available and we have projects, set up autocomplete
-        if ARGCOMPLETE_AVAILABLE and all_projects:
-            project_arg.completer = ChoicesCompleter(all_projects)
-        
-        parser.add_argument(
-            "--ide",
-            default=None,
-            choices=["pycharm", "idea", "vscode", "code", "webstorm", "goland", "rider"],
-            help="IDE to use (pycharm, idea, vscode, webstorm, goland, rider)"
-        )
-        
-        # If argcomplete is available, activate it
-        if ARGCOMPLETE_AVAILABLE:
-            argcomplete.autocomplete(parser)
-        
-        args = parser.parse_args(open_args)
-        
-        open_in_ide(project_to_open, args.ide)
-        return
+def _format_age(mtime: "datetime", now: "datetime") -> str:
+    """
+    Describe how long ago mtime was, e.g. 'today' or '3 weeks ago'.
     
-    # Check if list command is being used (could be "list", "ls", or "glon list", "glon ls")
-    if "list" in sys.argv or "ls" in sys.argv:
-        # Filter out 'list' or 'ls' from sys.argv for the list parser
-        list_args = [arg for arg in sys.argv[1:] if arg not in ("list", "ls")]
-        
-        # Simple parser for list command
-        parser = argparse.ArgumentParser(
-            description="List all cloned projects",
-            prog="glon list"
-        )
-        parser.add_argument(
-            "--base-path",
-            help="Base path to search (default: ~/github)",
-            default=None
-        )
-        parser.add_argument(
-            "--last",
-            dest="last",
-            choices=["today", "week", "month", "3months", "6months", "year"],
-            help="Filter by time: today, week, month, 3months, 6months, year"
-        )
-        parser.add_argument(
-            "filter",
-            nargs="*",
-            default=None,
-            help="Time filter (e.g., 'last month', 'last week', 'today', '30' for days)"
-        )
-        parser.add_argument(
-            "--verbose",
-            "-v",
-            action="store_true",
-            help="Verbose output with full paths"
-        )
-        parser.add_argument(
-            "--limit",
-            type=int,
-            default=None,
-            help="Limit number of results"
-        )
-        args = parser.parse_args(list_args)
-        
-        # Use --last if provided, otherwise use positional filter
-        time_filter = None
-        if args.last:
-            time_filter = f"last {args.last}"
-        elif args.filter:
-            # Join filter words back together (e.g., "last week" -> "last week")
-            time_filter = " ".join(args.filter)
+    Args:
+        mtime: Modification time
+        now: Reference time
         
-        list_projects(
-            base_path=args.base_path,
-            time_filter=time_filter,
-            verbose=args.verbose,
-            limit=args.limit
-        )
-        return
+    Returns:
+        Human readable age string
+    """
+    from datetime import timedelta
+    
+    today = now.replace(hour=0, minute=0, second=0, microsecond=0)
+    yesterday = today - timedelta(days=1)
+    age = now - mtime
+    if mtime >= today:
+        return "today"
+    elif mtime >= yesterday:
+        return "yesterday"
+    elif age.days < 7:
+        return f"{age.days} days ago"
+    elif age.days < 30:
+        return f"{age.days // 7} weeks ago"
+    return f"{age.days // 30} months ago"
+
+
+def _complete_projects(**kwargs: Any) -> List[str]:
+    """argcomplete completer for the 'open' project argument."""
+    return get_all_projects()
+
+
+def _positive_int(value: str) -> int:
+    """argparse type for options that need an integer greater than zero."""
+    import argparse
     
-    # Check if grab command is being used (could be "grab" or "glon grab")
-    if "grab" in sys.argv:
-        # Filter out 'grab' from sys.argv for the grab parser
-        grab_args = [arg for arg in sys.argv[1:] if arg != "grab"]
-        
-        # Simple parser for grab command
-        parser = argparse.ArgumentParser(
-            description="Grab path from clipboard and process it",
-            prog="glon grab"
-        )
-        parser.add_argument(
-            "--base-path",
-            help="Base path for output (default: ~/github)",
-            default=None
-        )
-        parser.add_argument(
-            "--dry-run",
-            action="store_true",
-            help="Show what would be done without actually doing it"
-        )
-        parser.add_argument(
-            "--verbose",
-            action="store_true",
-            help="Verbose output"
-        )
-        args = parser.parse_args(grab_args)
-        
-        success = grab_from_clipboard(
-            base_path=args.base_path,
-            dry_run=args.dry_run,
-            verbose=args.verbose
-        )
-        return
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: {value!r}")
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be a positive integer: {value!r}")
+    return number
+
+
+def _build_parser() -> "argparse.ArgumentParser":
+    """
+    Build the glon argument parser with all subcommands.
     
-    # Check if clone subcommand is being used
-    use_clone_subcommand = len(sys.argv) > 1 and sys.argv[1] == "clone"
+    Returns:
+        Configured ArgumentParser
+    """
+    import argparse
     
-    # Create main parser with URL as positional argument for backward compatibility
     parser = argparse.ArgumentParser(
         description="Git Clone utility - Clone repositories to organized directory structure",
-        prog="glon"
+        prog="glon",
+        epilog="Running 'glon [options] <url>' without a command is the same as 'glon clone [options] <url>'."
     )
+    subparsers = parser.add_subparsers(dest="command", metavar="command")
     
-    parser.add_argument(
+    # clone
+    clone_parser = subparsers.add_parser(
+        "clone",
+        help="Clone a repository (default command)",
+        description="Clone a repository to the organized directory structure"
+    )
+    clone_parser.add_argument(
         "url",
         nargs="?",
         default=None,
         help="Git repository URL (SSH or HTTPS). If omitted, will try to use clipboard."
     )
-    
-    parser.add_argument(
+    clone_parser.add_argument(
         "--base-path",
         help="Base path for cloning (default: ~/github)",
         default=None
     )
-    
-    parser.add_argument(
+    clone_parser.add_argument(
         "--dry-run",
         action="store_true",
         help="Show what would be done without actually cloning"
     )
+    clone_parser.add_argument(
+        "--verbose",
+        action="store_true",
+        help="Verbose output"
+    )
+    clone_parser.add_argument(
+        "--depth",
+        type=_positive_int,
+        default=None,
+        help="Create a shallow clone truncated to this many commits"
+    )
+    clone_parser.add_argument(
+        "--blobless",
+        action="store_true",
+        help="Partial clone without file contents (--filter=blob:none); blobs are fetched on demand"
+    )
+    clone_parser.add_argument(
+        "--single-branch",
+        action="store_true",
+        help="Clone only the history of the default branch"
+    )
+    clone_parser.add_argument(
+        "--submodule-jobs",
+        type=_positive_int,
+        default=None,
+        help="Clone submodules recursively using this many parallel jobs"
+    )
     
-    parser.add_argument(
+    # open
+    open_parser = subparsers.add_parser(
+        "open",
+        help="Open project in IDE",
+        description="Open project in IDE"
+    )
+    project_arg = open_parser.add_argument(
+        "project",
+        nargs="?",
+        default=None,
+        help="Project path (owner/repo or full path). If omitted, will try to use clipboard."
+    )
+    # Called by argcomplete only while completing this argument, so the
+    # project walk never runs on a normal invocation
+    project_arg.completer = _complete_projects  # type: ignore[attr-defined]
+    open_parser.add_argument(
+        "--ide",
+        default=None,
+        choices=_IDE_CHOICES,
+        help="IDE to use (pycharm, idea, vscode, webstorm, goland, rider)"
+    )
+    
+    # list / ls
+    list_parser = subparsers.add_parser(
+        "list",
+        aliases=["ls"],
+        help="List all cloned projects",
+        description="List all cloned projects"
+    )
+    list_parser.add_argument(
+        "--base-path",
+        help="Base path to search (default: ~/github)",
+        default=None
+    )
+    list_parser.add_argument(
+        "--last",
+        dest="last",
+        choices=["today", "week", "month", "3months", "6months", "year"],
+        help="Filter by time: today, week, month, 3months, 6months, year"
+    )
+    list_parser.add_argument(
+        "filter",
+        nargs="*",
+        default=None,
+        help="Time filter (e.g., 'last month', 'last week', 'today', '30' for days)"
+    )
+    list_parser.add_argument(
+        "--verbose",
+        "-v",
+        action="store_true",
+        help="Verbose output with full paths"
+    )
+    list_parser.add_argument(
+        "--limit",
+        type=_positive_int,
+        default=None,
+        help="Limit number of results"
+    )
+    
+    # grab
+    grab_parser = subparsers.add_parser(
+        "grab",
+        help="Grab path from clipboard and process it",
+        description="Grab path from clipboard and process it"
+    )
+    grab_parser.add_argument(
+        "--base-path",
+        help="Base path for output (default: ~/github)",
+        default=None
+    )
+    grab_parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Show what would be done without actually doing it"
+    )
+    grab_parser.add_argument(
         "--verbose",
         action="store_true",
         help="Verbose output"
     )
     
-    args = parser.parse_args()
+    return parser
+
+
+def _open_command(project_name: Optional[str], ide: Optional[str] = None) -> None:
+    """
+    Run 'glon open': resolve a project and open it in an IDE.
     
-    # If clone subcommand was used, remove it from args handling
-    if use_clone_subcommand:
-        # The URL would be in sys.argv[2] if provided
-        if args.url is None and len(sys.argv) > 2:
-            args.url = sys.argv[2]
+    Args:
+        project_name: Project name, owner/repo or path; None checks the
+            clipboard and then offers recent projects
+        ide: IDE to use (if None, the user is prompted)
+    """
+    from datetime import datetime, timedelta
+    
+    # If no project specified, check clipboard first
+    if project_name is None:
+        # Try to get clipboard content
+        clipboard_content = _read_clipboard_text()
+        if clipboard_content:
+            # Extract git URL from clipboard (handles multi-line content)
+            git_url = _extract_git_url_from_text(clipboard_content)
+            if git_url:
+                parsed = parse_git_url(git_url)
+                if parsed:
+                    owner, repo = parsed
+                    print(f"Detected git URL in clipboard: {git_url}")
+                    
+                    # Check if project already exists
+                    project_path = Path(_DEFAULT_BASE) / owner / repo
+                    
+                    if project_path.exists():
+                        print(f"Project already exists at: {project_path}")
+                        # Continue with opening this project
+                    else:
+                        print(f"Project not found locally. Cloning first...")
+                        # Clone the repository
+                        target_dir = create_directory_structure(owner, repo)
+                        success = clone_repository(git_url, target_dir)
+                        if success:
+                            project_path = target_dir
+                        else:
+                            print("Failed to clone repository. Showing available projects:")
+                            for project in get_all_projects():
+                                print(f"  {project}")
+                            print("\nUsage: glon open <project>")
+                            print("Example: glon open tom-sapletta-com/xeen")
+                            return
+                    
+                    open_in_ide(str(project_path), ide)
+                    return
+        
+        # No valid clipboard content, show numbered list of recent projects
+        all_projects_with_time = get_all_projects_with_time()
+        if not all_projects_with_time:
+            print("No projects found.")
+            return
+        
+        # Show last 10 projects sorted by modification time
+        recent_projects = all_projects_with_time[:10]
+        print(f"\nRecent projects (last {len(recent_projects)}):")
+        print("-" * 50)
+        now = datetime.now()
+        
+        for i, p in enumerate(recent_projects, 1):
+            print(f"  {i}. {p['name']} ({_format_age(p['mtime'], now)})")
+        
+        print("-" * 50)
+        
+        try:
+            choice = input(f"Select project (1-{len(recent_projects)}) or press Enter to cancel: ").strip()
+            if not choice:
+                print("Canceled.")
+                return
+            
+            idx = int(choice) - 1
+            if 0 <= idx < len(recent_projects):
+                open_in_ide(recent_projects[idx]["name"], ide)
+            else:
+                print(f"Invalid selection: {choice}")
+        except ValueError:
+            print(f"Invalid input: {choice}")
+        except EOFError:
+            print("No input received.")
+        return
     
-    if args.url is None:
-        args.url = _clipboard_url_candidate()
-        if args.url is None:
-            print("Error: Missing git URL. Provide URL argument or copy a valid git URL to clipboard.")
+    # Check if it's a full path (absolute path provided directly)
+    if os.path.isabs(project_name) or Path(project_name).exists():
+        # It's a full path, use it directly
+        full_path = Path(project_name).resolve()
+        if full_path.exists() and full_path.is_dir():
+            open_in_ide(str(full_path), ide)
             return
     
+    # Get all projects with their modification times
+    all_projects_with_time = get_all_projects_with_time()
+    
+    # Filter projects that match the input (case-insensitive partial match)
+    matching_projects_with_time = [
+        p for p in all_projects_with_time 
+        if project_name.lower() in p["name"].lower()
+    ]
+    
+    if not matching_projects_with_time:
+        print(f"No projects found matching: {project_name}")
+        print("\nAvailable projects:")
+        for project in sorted(p["name"] for p in all_projects_with_time):
+            print(f"  {project}")
+        return
+    
+    # Get project names from matches
+    matching_projects = [p["name"] for p in matching_projects_with_time]
+    
+    # If there's exactly one match, use it
+    if len(matching_projects) == 1:
+        project_to_open = matching_projects[0]
+    else:
+        # Multiple matches - use smart selection
+        now = datetime.now()
+        today = now.replace(hour=0, minute=0, second=0, microsecond=0)
+        yesterday = today - timedelta(days=1)
+        
+        # Check if any matching project was modified today
+        today_projects = [p for p in matching_projects_with_time if p["mtime"] >= today]
+        yesterday_projects = [p for p in matching_projects_with_time if p["mtime"] >= yesterday]
+        
+        if today_projects:
+            # Use the most recently modified project from today
+            most_recent = max(today_projects, key=lambda x: x["mtime"])
+            project_to_open = most_recent["name"]
+            print(f"Opening most recently modified (today): {project_to_open}")
+        elif len(yesterday_projects) >= 1:
+            # Multiple matches from yesterday or older - show interactive selection
+            print(f"Projects matching '{project_name}':")
+            print("-" * 50)
+            for i, p in enumerate(matching_projects_with_time, 1):
+                print(f"  {i}. {p['name']} ({_format_age(p['mtime'], now)})")
+            
+            print("-" * 50)
+            try:
+                choice = input(f"Select project (1-{len(matching_projects)}) or press Enter for first: ").strip()
+                if choice:
+                    idx = int(choice) - 1
+                    if 0 <= idx < len(matching_projects):
+                        project_to_open = matching_projects[idx]
+                    else:
+                        print("Invalid selection, using first match.")
+                        project_to_open = matching_projects[0]
+                else:
+                    project_to_open = matching_projects[0]
+            except (ValueError, EOFError):
+                project_to_open = matching_projects[0]
+        else:
+            # No recent matches, use first one
+            project_to_open = matching_projects[0]
+    
+    open_in_ide(project_to_open, ide)
+
+
+def _clone_command(
+    url: Optional[str],
+    base_path: Optional[str] = None,
+    dry_run: bool = False,
+    verbose: bool = False,
+    depth: Optional[int] = None,
+    blobless: bool = False,
+    single_branch: bool = False,
+    submodule_jobs: Optional[int] = None
+) -> bool:
+    """
+    Run 'glon clone': clone a URL (or the clipboard URL) into base_path.
+    
+    Args:
+        url: Git URL, or None to use a URL from the clipboard
+        base_path: Base path for cloning (default: ~/github)
+        dry_run: Show what would be done without actually cloning
+        verbose: Verbose output
+        depth: Create a shallow clone with this many commits
+        blobless: Partial clone that fetches file contents on demand
+        single_branch: Clone only the default branch
+        submodule_jobs: Clone submodules recursively with this many jobs
+        
+    Returns:
+        True if successful, False otherwise
+    """
+    if url is None:
+        url = _clipboard_url_candidate()
+        if url is None:
+            print("Error: Missing git URL. Provide URL argument or copy a valid git URL to clipboard.")
+            return False
+    
     # Parse the URL
-    if args.verbose:
-        print(f"Parsing URL: {args.url}")
+    if verbose:
+        print(f"Parsing URL: {url}")
     
-    parsed = parse_git_url(args.url)
+    parsed = parse_git_url(url)
     if not parsed:
-        print(f"Error: Invalid git URL format: {args.url}")
+        print(f"Error: Invalid git URL format: {url}")
         print("Supported formats:")
         print("  SSH: git@github.com:owner/repo.git")
         print("  HTTPS: https://github.com/owner/repo.git")
-        return
+        return False
     
     owner, repo = parsed
     
-    if args.verbose:
+    if verbose:
         print(f"Owner: {owner}, Repository: {repo}")
     
     # Create directory structure
-    target_dir = create_directory_structure(owner, repo, args.base_path)
+    target_dir = create_directory_structure(owner, repo, base_path)
     
-    if args.verbose:
+    if verbose:
         print(f"Target directory: {target_dir}")
     
-    if args.dry_run:
-        print(f"Would clone {args.url} to {target_dir}")
-        return
+    if dry_run:
+        print(f"Would clone {url} to {target_dir}")
+        return True
     
     # Clone the repository
-    success = clone_repository(args.url, target_dir)
+    success = clone_repository(
+        url,
+        target_dir,
+        depth=depth,
+        blobless=blobless,
+        single_branch=single_branch,
+        submodule_jobs=submodule_jobs
+    )
     
     if not success:
-        return
+        return False
     
     print(f"Repository ready at: {target_dir}")
+    return True
+
+
+def main():
+    """Main CLI entry point."""
+    argv = sys.argv[1:]
+    
+    # Fast path for the most common call, "glon <url>": nothing to parse,
+    # so skip building the argument parser altogether
+    if (
+        len(argv) == 1
+        and not argv[0].startswith("-")
+        and argv[0] not in _SUBCOMMANDS
+        and not os.environ.get("_ARGCOMPLETE")
+    ):
+        _clone_command(argv[0])
+        return
+    
+    # "glon [options] <url>" is shorthand for "glon clone [options] <url>"
+    if not argv or (argv[0] not in _SUBCOMMANDS and argv[0] not in ("-h", "--help")):
+        argv = ["clone"] + argv
+    
+    parser = _build_parser()
+    
+    # argcomplete only does work when the shell is completing (it sets
+    # _ARGCOMPLETE), so only import it then
+    if os.environ.get("_ARGCOMPLETE"):
+        try:
+            import argcomplete
+        except ImportError:
+            pass
+        else:
+            argcomplete.autocomplete(parser)
+    
+    args = parser.parse_args(argv)
+    
+    if args.command == "open":
+        _open_command(args.project, args.ide)
+    elif args.command in ("list", "ls"):
+        # Use --last if provided, otherwise use positional filter
+        time_filter = None
+        if args.last:
+            time_filter = f"last {args.last}"
+        elif args.filter:
+            # Join filter words back together (e.g., "last week" -> "last week")
+            time_filter = " ".join(args.filter)
+        
+        list_projects(
+            base_path=args.base_path,
+            time_filter=time_filter,
+            verbose=args.verbose,
+            limit=args.limit
+        )
+    elif args.command == "grab":
+        grab_from_clipboard(
+            base_path=args.base_path,
+            dry_run=args.dry_run,
+            verbose=args.verbose
+        )
+    else:
+        _clone_command(
+            args.url,
+            base_path=args.base_path,
+            dry_run=args.dry_run,
+            verbose=args.verbose,
+            depth=args.depth,
+            blobless=args.blobless,
+            single_branch=args.single_branch,
+            submodule_jobs=args.submodule_jobs
+        )
 
 
 if __name__ == "__main__":
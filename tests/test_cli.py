@@ -55,6 +55,24 @@ class TestParseGitUrl:
         result = parse_git_url(url)
         
         assert result == ("user", "project")
+    
+    def test_parse_ssh_url_without_git_suffix(self):
+        """Test SSH URLs still require the .git suffix."""
+        assert parse_git_url("git@github.com:owner/repo") is None
+    
+    def test_parse_url_edge_cases(self):
+        """Test inputs outside the fast path match the regex results."""
+        assert parse_git_url("https://github.com/owner/repo.git.git") == ("owner", "repo.git")
+        assert parse_git_url("https://github.com/owner/.git") == ("owner", ".git")
+        assert parse_git_url("https://github.com/owner/repo/extra") is None
+        assert parse_git_url("git@github.com:owner/.git") is None
+        assert parse_git_url("git@github.com:owner/sub/repo.git") is None
+    
+    def test_parse_url_trailing_newline(self):
+        """Test a trailing newline is handled like the regex "$" handles it."""
+        assert parse_git_url("https://github.com/owner/repo.git\n") == ("owner", "repo")
+        assert parse_git_url("git@github.com:owner/repo.git\n") == ("owner", "repo")
+        assert parse_git_url("https://github.com/owner/repo\n") == ("owner", "repo\n")
 
 
 class TestCreateDirectoryStructure:
@@ -63,8 +81,8 @@ class TestCreateDirectoryStructure:
     def test_create_directory_default_path(self):
         """Test creating directory with default path."""
         with tempfile.TemporaryDirectory() as temp_dir:
-            # Mock expanduser to use temp directory
-            with patch('os.path.expanduser', return_value=temp_dir):
+            # Point the default base path at the temp directory
+            with patch('glon.cli._DEFAULT_BASE', temp_dir):
                 target_dir = create_directory_structure("owner", "repo")
                 
                 expected_path = Path(temp_dir) / "owner" / "repo"
@@ -123,6 +141,31 @@ class TestCloneRepository:
                 check=True
             )
     
+    @patch('subprocess.run')
+    def test_clone_with_options(self, mock_run):
+        """Test repository cloning with shallow/partial clone options."""
+        mock_run.return_value = MagicMock(returncode=0, stdout="", stderr="")
+        
+        with tempfile.TemporaryDirectory() as temp_dir:
+            target_dir = Path(temp_dir) / "target"
+            target_dir.mkdir()
+            
+            url = "https://github.com/owner/repo.git"
+            result = clone_repository(
+                url, target_dir, depth=1, blobless=True,
+                single_branch=True, submodule_jobs=4
+            )
+            
+            assert result is True
+            mock_run.assert_called_once_with(
+                ["git", "clone", "--depth", "1", "--filter=blob:none",
+                 "--single-branch", "--recurse-submodules", "--jobs", "4",
+                 url, str(target_dir)],
+                capture_output=True,
+                text=True,
+                check=True
+            )
+    
     @patch('subprocess.run')
     def test_clone_git_error(self, mock_run):
         """Test repository cloning with git error."""
@@ -153,6 +196,68 @@ class TestCloneRepository:
             
             assert result is False
     
+    @patch('subprocess.run')
+    def test_clone_with_libgit2(self, mock_run):
+        """Test cloning through pygit2 when GLON_USE_LIBGIT2 is set."""
+        mock_pygit2 = MagicMock()
+        mock_pygit2.GitError = Exception
+        
+        with tempfile.TemporaryDirectory() as temp_dir:
+            target_dir = Path(temp_dir) / "target"
+            target_dir.mkdir()
+            
+            url = "https://github.com/owner/repo.git"
+            with patch.dict('sys.modules', {'pygit2': mock_pygit2}):
+                with patch.dict('os.environ', {'GLON_USE_LIBGIT2': '1'}):
+                    result = clone_repository(url, target_dir)
+            
+            assert result is True
+            mock_pygit2.clone_repository.assert_called_once_with(
+                url, str(target_dir), callbacks=None
+            )
+            mock_run.assert_not_called()
+    
+    @patch('subprocess.run')
+    def test_clone_ssh_with_libgit2_uses_agent(self, mock_run):
+        """Test SSH URLs cloned through pygit2 authenticate via ssh-agent."""
+        mock_pygit2 = MagicMock()
+        mock_pygit2.GitError = Exception
+        
+        with tempfile.TemporaryDirectory() as temp_dir:
+            target_dir = Path(temp_dir) / "target"
+            target_dir.mkdir()
+            
+            url = "git@github.com:owner/repo.git"
+            with patch.dict('sys.modules', {'pygit2': mock_pygit2}):
+                with patch.dict('os.environ', {'GLON_USE_LIBGIT2': '1'}):
+                    result = clone_repository(url, target_dir)
+            
+            assert result is True
+            mock_pygit2.KeypairFromAgent.assert_called_once_with("git")
+            mock_pygit2.RemoteCallbacks.assert_called_once_with(
+                credentials=mock_pygit2.KeypairFromAgent.return_value
+            )
+            mock_pygit2.clone_repository.assert_called_once_with(
+                url, str(target_dir), callbacks=mock_pygit2.RemoteCallbacks.return_value
+            )
+            mock_run.assert_not_called()
+    
+    def test_clone_with_libgit2_value_error(self):
+        """Test pygit2 errors raised as ValueError are reported, not raised."""
+        mock_pygit2 = MagicMock()
+        mock_pygit2.GitError = type("GitError", (Exception,), {})
+        mock_pygit2.clone_repository.side_effect = ValueError("unsupported URL protocol")
+        
+        with tempfile.TemporaryDirectory() as temp_dir:
+            target_dir = Path(temp_dir) / "target"
+            target_dir.mkdir()
+            
+            with patch.dict('sys.modules', {'pygit2': mock_pygit2}):
+                with patch.dict('os.environ', {'GLON_USE_LIBGIT2': '1'}):
+                    result = clone_repository("https://github.com/owner/repo.git", target_dir)
+            
+            assert result is False
+    
     def test_clone_non_empty_directory(self):
         """Test cloning to non-empty directory."""
         with tempfile.TemporaryDirectory() as temp_dir:
@@ -168,6 +273,353 @@ class TestCloneRepository:
             assert result is False
 
 
+class TestParseTimeFilter:
+    """Test cases for time filter parsing."""
+    
+    def test_parse_known_filters(self):
+        """Test aliases map to the expected number of days."""
+        from datetime import datetime, timedelta
+        from glon.cli import parse_time_filter
+        now = datetime(2024, 6, 1, 12, 0)
+        
+        assert parse_time_filter("today", now) == now - timedelta(days=1)
+        assert parse_time_filter("Last Week ", now) == now - timedelta(days=7)
+        assert parse_time_filter("month", now) == now - timedelta(days=30)
+        assert parse_time_filter("last 3months", now) == now - timedelta(days=90)
+        assert parse_time_filter("6 months", now) == now - timedelta(days=180)
+        assert parse_time_filter("last year", now) == now - timedelta(days=365)
+    
+    def test_parse_all_and_unknown_filters(self):
+        """Test 'all' and unknown filters do not produce a cutoff."""
+        from glon.cli import parse_time_filter
+        
+        assert parse_time_filter("all") is None
+        assert parse_time_filter("*") is None
+        assert parse_time_filter("fortnight") is None
+
+
+class TestRunCommands:
+    """Test cases for batched command execution."""
+    
+    @patch('subprocess.run')
+    def test_run_single_command(self, mock_run):
+        """Test a single command is run directly without a shell."""
+        from glon.cli import _run_commands
+        _run_commands([["git", "clone", "url", "target"]])
+        
+        mock_run.assert_called_once_with(
+            ["git", "clone", "url", "target"],
+            capture_output=True,
+            text=True,
+            check=True
+        )
+    
+    @patch('os.name', 'posix')
+    @patch('subprocess.run')
+    def test_run_multiple_commands_in_one_shell(self, mock_run):
+        """Test several commands are chained into one quoted shell call."""
+        from glon.cli import _run_commands
+        _run_commands([
+            ["git", "clone", "url", "my dir"],
+            ["git", "-C", "my dir", "config", "core.autocrlf", "false"],
+        ])
+        
+        mock_run.assert_called_once_with(
+            ["sh", "-c", "git clone url 'my dir' && git -C 'my dir' config core.autocrlf false"],
+            capture_output=True,
+            text=True,
+            check=True
+        )
+    
+    @patch('os.name', 'posix')
+    def test_run_multiple_commands_missing_executable(self):
+        """Test a missing executable in a batch raises FileNotFoundError."""
+        from glon.cli import _run_commands
+        with pytest.raises(FileNotFoundError):
+            _run_commands([["glon-no-such-command"], ["true"]])
+    
+    @patch('os.name', 'posix')
+    def test_run_multiple_commands_failure(self):
+        """Test other failures in a batch still raise CalledProcessError."""
+        from glon.cli import _run_commands
+        with pytest.raises(subprocess.CalledProcessError):
+            _run_commands([["true"], ["false"]])
+    
+    def test_run_no_commands(self):
+        """Test an empty batch is rejected on every platform."""
+        from glon.cli import _run_commands
+        for os_name in ('posix', 'nt'):
+            with patch('os.name', os_name):
+                with pytest.raises(ValueError):
+                    _run_commands([])
+
+
+class TestProjectScanning:
+    """Test cases for project directory scanning."""
+    
+    def setup_method(self):
+        """Keep the project cache out of the real user cache directory."""
+        import glon.cli
+        self.cache_dir = tempfile.TemporaryDirectory()
+        self.env_patch = patch.dict('os.environ', {'XDG_CACHE_HOME': self.cache_dir.name})
+        self.env_patch.start()
+        glon.cli._projects_cache.clear()
+    
+    def teardown_method(self):
+        """Restore the environment and drop cached scans."""
+        import glon.cli
+        self.env_patch.stop()
+        self.cache_dir.cleanup()
+        glon.cli._projects_cache.clear()
+    
+    def _make_tree(self, base):
+        """Create owner/repo directories plus some stray files."""
+        (base / "alice" / "one" / ".git").mkdir(parents=True)
+        (base / "alice" / "two").mkdir(parents=True)
+        (base / "bob" / "three").mkdir(parents=True)
+        (base / "alice" / "notes.txt").write_text("not a repo")
+        (base / "README.md").write_text("not an owner")
+        os.utime(base / "alice" / "one", (1000, 1000))
+        os.utime(base / "alice" / "two", (3000, 3000))
+        os.utime(base / "bob" / "three", (2000, 2000))
+    
+    def test_get_all_projects(self):
+        """Test collecting owner/repo names from the base path."""
+        from glon.cli import get_all_projects
+        with tempfile.TemporaryDirectory() as temp_dir:
+            self._make_tree(Path(temp_dir))
+            
+            result = get_all_projects(temp_dir)
+            
+            assert result == ["alice/one", "alice/two", "bob/three"]
+    
+    def test_get_all_projects_cached(self):
+        """Test unchanged trees are served from the cache without rescanning."""
+        from glon.cli import get_all_projects
+        with tempfile.TemporaryDirectory() as temp_dir:
+            self._make_tree(Path(temp_dir))
+            first = get_all_projects(temp_dir)
+            
+            with patch('glon.cli._scan_projects') as mock_scan:
+                second = get_all_projects(temp_dir)
+            
+            assert second == first
+            mock_scan.assert_not_called()
+    
+    def test_get_all_projects_cache_invalidated(self):
+        """Test adding a repo under an existing owner invalidates the cache."""
+        from glon.cli import get_all_projects
+        with tempfile.TemporaryDirectory() as temp_dir:
+            base = Path(temp_dir)
+            self._make_tree(base)
+            get_all_projects(temp_dir)
+            
+            (base / "bob" / "four").mkdir()
+            os.utime(base / "bob", ns=(1, 1))
+            
+            assert "bob/four" in get_all_projects(temp_dir)
+    
+    def test_get_all_projects_cache_persisted(self):
+        """Test the cache is reloaded from disk in a fresh process."""
+        import glon.cli
+        from glon.cli import get_all_projects
+        with tempfile.TemporaryDirectory() as temp_dir:
+            self._make_tree(Path(temp_dir))
+            first = get_all_projects(temp_dir)
+            glon.cli._projects_cache.clear()
+            
+            with patch('glon.cli._scan_projects') as mock_scan:
+                second = get_all_projects(temp_dir)
+            
+            assert second == first
+            mock_scan.assert_not_called()
+            assert (Path(self.cache_dir.name) / "glon" / "projects.json").exists()
+    
+    def test_get_all_projects_with_time_sorted(self):
+        """Test projects are returned newest first with their paths."""
+        from glon.cli import get_all_projects_with_time
+        with tempfile.TemporaryDirectory() as temp_dir:
+            self._make_tree(Path(temp_dir))
+            
+            result = get_all_projects_with_time(temp_dir)
+            
+            assert [p["name"] for p in result] == ["alice/two", "bob/three", "alice/one"]
+            assert result[0]["path"] == Path(temp_dir) / "alice" / "two"
+    
+    def test_get_all_projects_missing_base(self):
+        """Test scanning a base path that does not exist."""
+        from glon.cli import get_all_projects
+        assert get_all_projects("/nonexistent/path/12345") == []
+    
+    def test_list_projects(self, capsys):
+        """Test listing projects prints newest first."""
+        from glon.cli import list_projects
+        with tempfile.TemporaryDirectory() as temp_dir:
+            self._make_tree(Path(temp_dir))
+            
+            result = list_projects(base_path=temp_dir)
+            
+            output = capsys.readouterr().out
+            assert result is True
+            assert "Found 3 project(s)" in output
+            assert output.index("alice/two") < output.index("bob/three") < output.index("alice/one")
+            assert "✓ alice/one" in output
+            assert "✗ alice/two" in output
+    
+    def test_list_projects_limit(self, capsys):
+        """Test limiting the listing keeps the newest projects."""
+        from glon.cli import list_projects
+        with tempfile.TemporaryDirectory() as temp_dir:
+            self._make_tree(Path(temp_dir))
+            
+            list_projects(base_path=temp_dir, limit=2)
+            
+            output = capsys.readouterr().out
+            assert "Found 3 project(s)" in output
+            assert "Showing 2 result(s)" in output
+            assert output.index("alice/two") < output.index("bob/three")
+            assert "alice/one" not in output
+    
+    def test_list_projects_verbose(self, capsys):
+        """Test verbose listing shows path, date and git status per project."""
+        from glon.cli import list_projects
+        with tempfile.TemporaryDirectory() as temp_dir:
+            base = Path(temp_dir)
+            self._make_tree(base)
+            
+            list_projects(base_path=temp_dir, verbose=True, limit=1)
+            
+            output = capsys.readouterr().out
+            assert f"alice/two\n  Path: {base / 'alice' / 'two'}\n" in output
+            assert "  Git: No\n\n" in output
+    
+    def _git_checks(self, mock_exists):
+        """Return the .git paths checked through os.path.exists."""
+        return [c.args[0] for c in mock_exists.call_args_list
+                if str(c.args[0]).endswith(".git")]
+    
+    def test_list_projects_limit_checks_git_for_shown_rows(self, capsys):
+        """Test --limit only checks .git for the projects that are printed."""
+        from glon.cli import list_projects
+        with tempfile.TemporaryDirectory() as temp_dir:
+            self._make_tree(Path(temp_dir))
+            os.utime(Path(temp_dir) / "alice" / "one", (4000, 4000))
+            
+            with patch('os.path.exists', wraps=os.path.exists) as mock_exists:
+                list_projects(base_path=temp_dir, limit=1)
+            
+            output = capsys.readouterr().out
+            assert "✓ alice/one" in output
+            assert self._git_checks(mock_exists) == [
+                os.path.join(temp_dir, "alice", "one", ".git")
+            ]
+    
+    def test_list_projects_time_filter_skips_git_for_old_repos(self, capsys):
+        """Test repos dropped by the time filter are never checked for .git."""
+        from glon.cli import list_projects
+        with tempfile.TemporaryDirectory() as temp_dir:
+            base = Path(temp_dir)
+            self._make_tree(base)
+            (base / "bob" / "fresh").mkdir()
+            
+            with patch('os.path.exists', wraps=os.path.exists) as mock_exists:
+                list_projects(base_path=temp_dir, time_filter="today")
+            
+            output = capsys.readouterr().out
+            assert "Found 1 project(s)" in output
+            assert "✗ bob/fresh" in output
+            assert self._git_checks(mock_exists) == [
+                os.path.join(temp_dir, "bob", "fresh", ".git")
+            ]
+
+
+class TestReadClipboardText:
+    """Test cases for clipboard reading backends."""
+
+    def test_read_with_pyperclip(self):
+        """Test reading clipboard through pyperclip when it is installed."""
+        mock_pyperclip = MagicMock()
+        mock_pyperclip.paste.return_value = "git@github.com:owner/repo.git"
+
+        with patch.dict('sys.modules', {'pyperclip': mock_pyperclip}):
+            with patch('subprocess.run') as mock_run:
+                from glon.cli import _read_clipboard_text
+                result = _read_clipboard_text()
+
+                assert result == "git@github.com:owner/repo.git"
+                mock_run.assert_not_called()
+
+    def test_read_strips_pyperclip_text(self):
+        """Test pyperclip text is stripped like the command output."""
+        mock_pyperclip = MagicMock()
+        mock_pyperclip.paste.return_value = "  https://github.com/owner/repo\n"
+
+        with patch.dict('sys.modules', {'pyperclip': mock_pyperclip}):
+            from glon.cli import _read_clipboard_text
+            assert _read_clipboard_text() == "https://github.com/owner/repo"
+
+    @patch('glon.cli._get_clipboard_commands', return_value=[["xclip", "-o"]])
+    @patch('subprocess.run')
+    def test_read_empty_pyperclip_is_final(self, mock_run, mock_commands):
+        """Test an empty pyperclip read skips the commands and Tk."""
+        mock_pyperclip = MagicMock()
+        mock_pyperclip.paste.return_value = ""
+        mock_tkinter = MagicMock()
+
+        with patch.dict('sys.modules', {'pyperclip': mock_pyperclip, 'tkinter': mock_tkinter}):
+            from glon.cli import _read_clipboard_text
+            assert _read_clipboard_text() is None
+
+            mock_run.assert_not_called()
+            mock_tkinter.Tk.assert_not_called()
+
+    @patch('glon.cli._get_clipboard_commands', return_value=[["wl-paste"], ["xclip", "-o"]])
+    @patch('subprocess.run')
+    def test_read_empty_command_output_is_final(self, mock_run, mock_commands):
+        """Test a command that exits 0 with no text ends the search."""
+        mock_run.return_value = MagicMock(stdout="\n")
+        mock_tkinter = MagicMock()
+
+        with patch.dict('sys.modules', {'pyperclip': None, 'tkinter': mock_tkinter}):
+            from glon.cli import _read_clipboard_text
+            assert _read_clipboard_text() is None
+
+            mock_run.assert_called_once()
+            mock_tkinter.Tk.assert_not_called()
+
+    @patch('glon.cli._read_clipboard_text')
+    def test_clipboard_url_candidate(self, mock_clipboard):
+        """Test only single-line git URLs are accepted as clone candidates."""
+        from glon.cli import _clipboard_url_candidate
+
+        mock_clipboard.return_value = "git@github.com:owner/repo.git"
+        assert _clipboard_url_candidate() == "git@github.com:owner/repo.git"
+
+        mock_clipboard.return_value = "git@github.com:owner/repo.git\tcomment"
+        assert _clipboard_url_candidate() is None
+
+        mock_clipboard.return_value = "https://github.com/" + "a" * 200 + "/repo"
+        assert _clipboard_url_candidate() is None
+
+        mock_clipboard.return_value = None
+        assert _clipboard_url_candidate() is None
+
+    @patch('glon.cli._get_clipboard_commands', return_value=[["xclip", "-o"]])
+    @patch('subprocess.run')
+    def test_read_with_command_fallback(self, mock_run, mock_commands):
+        """Test falling back to clipboard commands without pyperclip."""
+        mock_run.return_value = MagicMock(stdout="https://github.com/owner/repo\n")
+
+        with patch.dict('sys.modules', {'pyperclip': None}):
+            from glon.cli import _read_clipboard_text
+            result = _read_clipboard_text()
+
+            assert result == "https://github.com/owner/repo"
+            mock_run.assert_called_once_with(
+                ["xclip", "-o"], capture_output=True, text=True, check=True
+            )
+
+
 class TestGrabFromClipboard:
     """Test cases for grab from clipboard functionality."""
     
@@ -200,15 +652,19 @@ class TestGrabFromClipboard:
         
         assert result is False
     
-    @patch('glon.cli._read_clipboard_text')
-    def test_grab_whitespace_clipboard(self, mock_clipboard):
+    @patch('glon.cli._get_clipboard_commands', return_value=[])
+    def test_grab_whitespace_clipboard(self, mock_commands):
         """Test grabbing from clipboard with only whitespace."""
-        mock_clipboard.return_value = "   \n\t  "
-        
-        from glon.cli import grab_from_clipboard
-        result = grab_from_clipboard()
+        mock_pyperclip = MagicMock()
+        mock_pyperclip.paste.return_value = "   \n\t  "
         
-        assert result is False
+        with patch.dict('sys.modules', {'pyperclip': mock_pyperclip, 'tkinter': None}):
+            with patch('builtins.print') as mock_print:
+                from glon.cli import grab_from_clipboard
+                result = grab_from_clipboard()
+                
+                assert result is False
+                mock_print.assert_any_call("Error: Clipboard is empty or could not be read.")
     
     @patch('glon.cli._read_clipboard_text')
     def test_grab_invalid_path(self, mock_clipboard):
@@ -246,6 +702,46 @@ class TestGrabFromClipboard:
                 # Should succeed (creates symlink)
                 assert result is True or result is False  # Depends on permissions
     
+    @patch('glon.cli._read_clipboard_text')
+    def test_grab_local_directory_creates_symlink(self, mock_clipboard):
+        """Test grabbing a local directory links it into the base path."""
+        import tempfile
+        with tempfile.TemporaryDirectory() as temp_dir:
+            source = Path(temp_dir) / "src" / "proj"
+            source.mkdir(parents=True)
+            base = Path(temp_dir) / "base"
+            mock_clipboard.return_value = str(source)
+            
+            from glon.cli import grab_from_clipboard
+            result = grab_from_clipboard(base_path=str(base))
+            
+            link_path = base / "proj" / "proj"
+            assert result is True
+            assert link_path.is_symlink()
+            assert link_path.resolve() == source.resolve()
+    
+    @patch('glon.cli._is_dir_empty', return_value=True)
+    @patch('glon.cli._read_clipboard_text')
+    def test_grab_keeps_existing_dangling_symlink(self, mock_clipboard, mock_empty):
+        """Test a dangling symlink appearing after the empty check is left alone."""
+        import tempfile
+        with tempfile.TemporaryDirectory() as temp_dir:
+            source = Path(temp_dir) / "src" / "proj"
+            source.mkdir(parents=True)
+            base = Path(temp_dir) / "base"
+            link_path = base / "proj" / "proj"
+            link_path.parent.mkdir(parents=True)
+            link_path.symlink_to(Path(temp_dir) / "missing")
+            mock_clipboard.return_value = str(source)
+            
+            with patch('builtins.print') as mock_print:
+                from glon.cli import grab_from_clipboard
+                result = grab_from_clipboard(base_path=str(base))
+                
+                assert result is True
+                mock_print.assert_any_call(f"Symlink already exists at {link_path}")
+            assert os.readlink(link_path) == str(Path(temp_dir) / "missing")
+    
     @patch('glon.cli._read_clipboard_text')
     @patch('glon.cli.parse_git_url')
     def test_grab_verbose_mode(self, mock_parse, mock_clipboard):
@@ -333,3 +829,95 @@ class TestCLIIntegration:
                 
                 mock_clone.assert_not_called()
                 mock_print.assert_any_call("Would clone https://github.com/owner/repo.git to /tmp/github/owner/repo")
+
+    @patch('glon.cli.open_in_ide')
+    @patch('glon.cli.get_all_projects')
+    @patch('glon.cli.get_all_projects_with_time')
+    def test_main_open_skips_completion_walk(self, mock_with_time, mock_all, mock_open):
+        """Test open command does not scan projects for completion outside argcomplete."""
+        from datetime import datetime
+        mock_with_time.return_value = [
+            {"name": "owner/repo", "mtime": datetime(2020, 1, 1)}
+        ]
+        
+        with patch('sys.argv', ['glon', 'open', 'owner/repo']):
+            with patch.dict('os.environ', {}, clear=False) as env:
+                env.pop('_ARGCOMPLETE', None)
+                from glon.cli import main
+                main()
+                
+                mock_all.assert_not_called()
+                mock_open.assert_called_once_with("owner/repo", None)
+    
+    @patch('glon.cli.clone_repository')
+    @patch('glon.cli.create_directory_structure')
+    @patch('glon.cli.list_projects')
+    def test_main_url_containing_subcommand_name(self, mock_list, mock_create, mock_clone):
+        """Test a URL whose repo is named like a subcommand is still cloned."""
+        mock_create.return_value = Path("/tmp/github/owner/list")
+        mock_clone.return_value = True
+        
+        with patch('sys.argv', ['glon', '--dry-run', 'https://github.com/owner/list']):
+            with patch('builtins.print') as mock_print:
+                from glon.cli import main
+                main()
+                
+                mock_list.assert_not_called()
+                mock_create.assert_called_once_with("owner", "list", None)
+                mock_print.assert_any_call("Would clone https://github.com/owner/list to /tmp/github/owner/list")
+    
+    @patch('glon.cli.list_projects')
+    def test_main_list_alias(self, mock_list):
+        """Test 'ls' dispatches to list with the joined time filter."""
+        with patch('sys.argv', ['glon', 'ls', 'last', 'week', '--limit', '5']):
+            from glon.cli import main
+            main()
+            
+            mock_list.assert_called_once_with(
+                base_path=None,
+                time_filter="last week",
+                verbose=False,
+                limit=5
+            )
+    
+    @patch('glon.cli._build_parser')
+    @patch('glon.cli._clone_command')
+    def test_main_url_fast_path(self, mock_clone_command, mock_build_parser):
+        """Test 'glon <url>' clones without building the argument parser."""
+        with patch('sys.argv', ['glon', 'https://github.com/owner/repo.git']):
+            from glon.cli import main
+            main()
+            
+            mock_clone_command.assert_called_once_with("https://github.com/owner/repo.git")
+            mock_build_parser.assert_not_called()
+    
+    @patch('glon.cli.create_directory_structure')
+    def test_main_rejects_non_positive_depth(self, mock_create):
+        """Test --depth and --submodule-jobs must be positive integers."""
+        from glon.cli import main
+        for argv in (
+            ['glon', '--depth', '0', '--dry-run', 'https://github.com/owner/repo.git'],
+            ['glon', '--depth', '-3', 'https://github.com/owner/repo.git'],
+            ['glon', '--submodule-jobs', '0', 'https://github.com/owner/repo.git'],
+            ['glon', '--depth', 'x', 'https://github.com/owner/repo.git'],
+        ):
+            with patch('sys.argv', argv):
+                with pytest.raises(SystemExit) as exc_info:
+                    main()
+                
+                assert exc_info.value.code == 2
+        
+        mock_create.assert_not_called()
+    
+    @patch('glon.cli.list_projects')
+    def test_main_rejects_non_positive_limit(self, mock_list):
+        """Test --limit must be a positive integer."""
+        from glon.cli import main
+        for limit in ('0', '-1'):
+            with patch('sys.argv', ['glon', 'list', '--limit', limit]):
+                with pytest.raises(SystemExit) as exc_info:
+                    main()
+                
+                assert exc_info.value.code == 2
+        
+        mock_list.assert_not_called()